@@ -2,6 +2,27 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+# Constants
+KEYS_TO_EXCLUDE = frozenset(
+    (
+        "abstract",
+        "web_url",
+        "snippet",
+        "lead_paragraph",
+        "source",
+        "document_type",
+        "news_desk",
+        "type_of_material",
+    )
+)
+KEYWORD_LOCATIONS = "glocations"
+KEYWORD_ORGANIZATIONS = "organizations"
+
 
 def convert_published_date_value(data):
     """Converts the value in each article pub_date key.
@@ -11,7 +32,8 @@ def convert_published_date_value(data):
 
     '< Year >-< Month >-< Day >T< Hour >:< Minute >:< Second >< %z UTC offset >".
 
-    Hint: This function employs a nested for loop to interact with an article's key-value pairs.
+    The pub_date key is accessed directly rather than by looping over each article's
+    key-value pairs. Articles without a pub_date key are left unchanged.
 
     Parameters:
         data (list): A list of dictionaries, each containing information
@@ -23,12 +45,18 @@ def convert_published_date_value(data):
     """
 
     for article in data:
-        for key, value in article.items():
-            if key == "pub_date":
-                # Using datetime.strptime() method
-                article[key] = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
-                # Alternatively, using datetime.fromisoformat() method
-                # article[key] = datetime.fromisoformat(value[:-6] + value[-6:])
+        value = article.get("pub_date")
+        if value is not None:
+            # datetime.fromisoformat() is a C fast path for ISO 8601 strings; a "+0000"
+            # UTC offset is rewritten as "+00:00" for Python < 3.11
+            if value[-5] in "+-" and value[-3] != ":":
+                value = f"{value[:-2]}:{value[-2:]}"
+            pub_date = datetime.fromisoformat(value)
+            if pub_date.tzinfo is None:  # strptime's %z requires a UTC offset
+                raise ValueError(f"pub_date {value!r} lacks a UTC offset")
+            article["pub_date"] = pub_date
+            # Alternatively, using datetime.strptime() method
+            # article["pub_date"] = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
 
     return data
 
@@ -50,7 +78,7 @@ def create_headline_url_list(data):
     return [(article["headline"]["main"], article["web_url"]) for article in data]
 
 
-def filter_articles(data, keys_to_exclude):
+def filter_articles(data, keys_to_exclude=KEYS_TO_EXCLUDE):
     """Filters each dictionary down to necessary information within the given < data >
     list based on the < keys_to_exclude > list.
 
@@ -60,14 +88,18 @@ def filter_articles(data, keys_to_exclude):
     Parameters:
         data (list): A list of dictionaries, each containing information
                      about a technology-themed New York Times article.
-        keys_to_exclude (list): A list of key names to exclude from each article
-                                dictionary.
+        keys_to_exclude (list|set|frozenset): Key names to exclude from each article
+                                              dictionary (default: < KEYS_TO_EXCLUDE >).
 
     Returns:
         list: A list of dictionaries, each containing filtered information
               about a Technology themed New York Times article.
     """
 
+    # Hashed membership tests (O(1)) rather than list scans (O(n)) per key
+    if not isinstance(keys_to_exclude, (set, frozenset)):
+        keys_to_exclude = frozenset(keys_to_exclude)
+
     # Initialize an empty list to accumulate filtered articles
     filtered_articles = []
 
@@ -140,7 +172,7 @@ def get_organization_names(article):
     return [
         keyword["value"]
         for keyword in article.get("keywords", [])
-        if keyword.get("name") == "organizations"
+        if keyword.get("name") == KEYWORD_ORGANIZATIONS
     ]
 
 
@@ -164,7 +196,7 @@ def get_news_by_location(data, location):
         article
         for article in data
         if any(
-            keyword["name"] == "glocations" and location in keyword["value"]
+            keyword["name"] == KEYWORD_LOCATIONS and location in keyword["value"]
             for keyword in article.get("keywords", [])
         )
     ]
@@ -174,6 +206,10 @@ def read_json(filepath, encoding="utf-8"):
     """Reads a JSON document, decodes the file content, and returns a list or
     dictionary if provided with a valid filepath.
 
+    The file is read into memory in a single call and decoded by < orjson.loads > if the
+    optional < orjson > package is installed and the file is UTF-8 encoded; otherwise
+    the content is decoded by < json.loads >.
+
     Parameters:
         filepath (str): path to file
         encoding (str): name of encoding used to decode the file
@@ -182,8 +218,13 @@ def read_json(filepath, encoding="utf-8"):
         dict/list: dict or list representations of the decoded JSON document
     """
 
-    with open(filepath, "r", encoding=encoding) as file_obj:
-        return json.load(file_obj)
+    with open(filepath, "rb") as file_obj:
+        content = file_obj.read()
+
+    if orjson and encoding == "utf-8":
+        return orjson.loads(content)
+    else:
+        return json.loads(content.decode(encoding))
 
 
 def remove_empty_keywords_articles(data):
@@ -293,19 +334,8 @@ def main():
     # 2.0
     print("Problem 2:\n")
 
-    keys_to_exclude = [
-        "abstract",
-        "web_url",
-        "snippet",
-        "lead_paragraph",
-        "source",
-        "document_type",
-        "news_desk",
-        "type_of_material",
-    ]
-
     # 2.2
-    nyt_tech_filtered = filter_articles(nyt_tech_raw, keys_to_exclude)
+    nyt_tech_filtered = filter_articles(nyt_tech_raw, KEYS_TO_EXCLUDE)
 
     # 2.3
     filename = "stu-nyt-tech-filtered.json"
@@ -332,13 +362,11 @@ def main():
     print("Problem 4:\n")
 
     # 4.2
-    tech_organizations = []
-    for article in nyt_tech:
-        org_names = get_organization_names(article)
-        if org_names:
-            for name in org_names:
-                if name not in tech_organizations:
-                    tech_organizations.append(name)
+    tech_organizations = list(
+        dict.fromkeys(
+            name for article in nyt_tech for name in get_organization_names(article)
+        )
+    )
 
     # 4.3
     filename = "stu-unique-tech-organizations.json"
@@ -374,15 +402,14 @@ def main():
     print("Problem 7:\n")
 
     # 7.3
-    unique_authors = []
-
-    # 7.3.1-7.3.6
-    for article in nyt_tech:
-        authors = get_author_names(article)
-        if authors:
-            for author in authors:
-                if author is not None and author not in unique_authors:
-                    unique_authors.append(author)
+    unique_authors = list(
+        dict.fromkeys(
+            author
+            for article in nyt_tech
+            for author in get_author_names(article)
+            if author is not None
+        )
+    )
 
     # 7.4
     filename = "stu-unique-authors.json"
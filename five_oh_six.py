@@ -2,12 +2,38 @@ import csv
 import json
 import requests
 
+from requests.adapters import HTTPAdapter
 from urllib.parse import quote, urlencode, urljoin
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster JSON decoding
+except ImportError:
+    orjson = None
 
 # Constants
 NONE_VALUES = ("", "n/a", "none", "unknown")
 CACHE_FILEPATH = "./CACHE.json"
 
+# HTTP session shared by < get_resource > (connection pooling; 429/5xx retried with backoff)
+session = requests.Session()
+session.headers.update({"Accept": "application/json"})
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 def convert_none_values(data, convert):
     """Attempts to convert certain < data > values to < None > by passing each value in < data >
@@ -124,7 +150,8 @@ def create_cache_key(url, params=None):
     is not None, the "?" separator, and any URL encoded querystring fields and values.
     Passes to the function < urllib.parse.urljoin > the optional < quote_via=quote >
     argument to override the default behavior and encode spaces with '%20' rather
-    than "+".
+    than "+". Querystring fields are sorted so that equivalent < params > always mint
+    the same key regardless of insertion order.
 
     Example:
        url = https://swapi.py4e.com/api/people/
@@ -140,7 +167,7 @@ def create_cache_key(url, params=None):
     """
 
     if params:
-        return urljoin(url, f"?{urlencode(params, quote_via=quote)}").lower()  # space replaced with '%20'
+        return urljoin(url, f"?{urlencode(sorted(params.items()), quote_via=quote)}").lower()  # space replaced with '%20'
     else:
         return url.lower()
 
@@ -151,6 +178,16 @@ def get_resource(url, params=None, timeout=10):
     payload of one or more entities to be found in ['results'] list; otherwise, response
     object body is returned as a single dictionary representation of the entity.
 
+    Requests are issued through the module-level < session > so that connections to the
+    remote host are reused across calls. If the optional < orjson > package is installed
+    the response body is decoded with it; otherwise < Response.json() > is used.
+
+    WARN: Responses with a 429 or 5xx status code are retried up to three times with
+    exponential backoff (or per the server's Retry-After header). If every attempt fails
+    the last response body is decoded and returned, as without retries. Connection and
+    read errors are not retried. A single call can therefore block for up to four times
+    < timeout > plus the backoff delays.
+
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
@@ -161,9 +198,14 @@ def get_resource(url, params=None, timeout=10):
     """
 
     if params:
-        return requests.get(url, params, timeout=timeout).json()
+        response = session.get(url, params=params, timeout=timeout)
+    else:
+        response = session.get(url, timeout=timeout)
+
+    if orjson:
+        return orjson.loads(response.content)
     else:
-        return requests.get(url, timeout=timeout).json()
+        return response.json()
 
 
 def read_csv_to_dicts(filepath, encoding="utf-8", newline="", delimiter=","):
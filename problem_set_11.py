@@ -311,8 +311,9 @@ def get_swapi_resource(url, params=None, timeout=10):
     """
 
     key = utl.create_cache_key(url, params)
-    if key in cache.keys():
-        return copy.deepcopy(cache[key])  # recursive copy of objects
+    cached = cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)  # recursive copy of objects
     else:
         resource = utl.get_resource(url, params, timeout)
         cache[key] = copy.deepcopy(resource)  # recursive copy of objects
@@ -574,4 +575,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with utl.session:  # release pooled SWAPI connections on exit
+        main()